@@ -17,11 +17,19 @@ available on PyPi.org. If you use additional packages, please add a requirements
 lists them with their precise versions ("packageA==1.2.3").
 """
 from functools import total_ordering
-from typing import Any, List, Optional, List, Tuple, cast
+from array import array
+from collections import OrderedDict
+from bisect import bisect_right
+from heapq import heappop, heappush
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple, cast
 import time as t
 
 class Node:
-    """A node in a graph."""
+    """A node in a graph.
+
+    Nodes are compared and hashed by identity. Within a graph, every id must belong to exactly one
+    node object.
+    """
 
     def __init__(self, id: int):
         self.id: int = id
@@ -29,28 +37,23 @@ class Node:
 
     def edge_to(self, other: "Node") -> Optional["UndirectedEdge"]:
         """Returns the edge between the current node and the given one (if existing)."""
-        matches = [edge for edge in self.adjacent_edges if edge.other_end(self) == other]
+        matches = [edge for edge in self.adjacent_edges if edge.other_end(self) is other]
         return matches[0] if len(matches) > 0 else None
 
     def is_adjacent(self, other: "Node") -> bool:
         """Returns whether there is an edge between the current node and the given one."""
         return other in {edge.other_end(self) for edge in self.adjacent_edges}
 
-    def __eq__(self, other: Any) -> bool:
-        return isinstance(other, Node) and self.id == other.id
-
-    def __le__(self, other: Any) -> bool:
-        return isinstance(other, Node) and self.id <= other.id
-
-    def __hash__(self) -> int:
-        return self.id
-
     def __repr__(self) -> str:
         return f"Node({self.id})"
 
 
 class UndirectedEdge:
-    """An undirected edge in a graph."""
+    """An undirected edge in a graph.
+
+    Duplicate edges between the same end nodes are detected when the `UndirectedGraph` is built,
+    not when the edge is created.
+    """
 
     def __init__(self, end_nodes: Tuple[Node, Node], length: float):
         self.end_nodes: Tuple[Node, Node] = end_nodes
@@ -62,21 +65,19 @@ class UndirectedEdge:
                 f"Non-positive length {length} not supported."
             )
 
-        if any(e.other_end(end_nodes[0]) == end_nodes[1] for e in end_nodes[0].adjacent_edges):
-            raise ValueError("Duplicate edges are not supported")
-
-        if self.end_nodes[0] != self.end_nodes[1]:
+        if self.end_nodes[0] is not self.end_nodes[1]:
             self.end_nodes[0].adjacent_edges.append(self)
             self.end_nodes[1].adjacent_edges.append(self)
-            self.end_node_set = set(self.end_nodes)
 
     def other_end(self, start: Node) -> Node:
         """Returns the other end of the edge, given one of the end nodes."""
-        return self.end_nodes[0] if self.end_nodes[1] == start else self.end_nodes[1]
+        return self.end_nodes[0] if self.end_nodes[1] is start else self.end_nodes[1]
 
     def is_adjacent(self, other_edge: "UndirectedEdge") -> bool:
         """Returns whether the current edge shares an end node with the given edge."""
-        return len(self.end_node_set.intersection(other_edge.end_node_set)) > 0
+        a, b = self.end_nodes
+        c, d = other_edge.end_nodes
+        return a is c or a is d or b is c or b is d
 
     def __repr__(self) -> str:
         return (
@@ -85,12 +86,135 @@ class UndirectedEdge:
         )
 
 
+class _Csr(NamedTuple):
+    """Compressed sparse row (CSR) form of an undirected graph.
+
+    The nodes are numbered densely from 0 to V-1. The neighbors of node `i` are stored in the slots
+    `indptr[i]` to `indptr[i + 1] - 1` of `neighbors`, `weights` and `edges`, every edge appearing
+    once per direction. `adjacency[i]` holds the same slots of node `i` as
+    `(neighbor, weight, slot)` tuples, which is the fastest form to iterate in the search loop.
+    `component[i]` labels the connected component of node `i`.
+    """
+
+    index_by_id: Dict[int, int]
+    nodes: List[Node]
+    indptr: List[int]
+    neighbors: List[int]
+    weights: List[float]
+    edges: List[UndirectedEdge]
+    adjacency: List[List[Tuple[int, float, int]]]
+    component: List[int]
+
+
 class UndirectedGraph:
-    """A simple undirected graph with edges attributed with their length."""
+    """A simple undirected graph with edges attributed with their length.
+
+    Raises a ValueError on duplicate edges between the same two nodes. The rejected duplicate is
+    removed from the adjacency lists of its end nodes again. Listing the same edge object more than
+    once is not a duplicate. Self-loops are not checked, as they never enter the adjacency lists.
+    """
+
+    # Höchstzahl zwischengespeicherter vollständiger Dijkstra-Läufe je Graph
+    _SSSP_CACHE_SIZE = 16
+    # Anzahl der Anfragen ab einem Startknoten, ab der sein vollständiger Lauf gespeichert wird
+    _SSSP_PROMOTE_AFTER = 3
 
     def __init__(self, edges: List[UndirectedEdge]):
         self.edges: List[UndirectedEdge] = edges
-        self.nodes_by_id = {node.id: node for edge in self.edges for node in edge.end_nodes}
+        edge_by_end_ids: Dict[FrozenSet[int], UndirectedEdge] = {}
+        for edge in self.edges:
+            node_1, node_2 = edge.end_nodes
+            if node_1 is node_2:
+                continue
+            end_ids = frozenset((node_1.id, node_2.id))
+            seen_edge = edge_by_end_ids.setdefault(end_ids, edge)
+            if seen_edge is not edge:
+                node_1.adjacent_edges.remove(edge)
+                node_2.adjacent_edges.remove(edge)
+                raise ValueError("Duplicate edges are not supported")
+        self.nodes_by_id: Dict[int, Node] = {}
+        for edge in self.edges:
+            for node in edge.end_nodes:
+                if self.nodes_by_id.setdefault(node.id, node) is not node:
+                    raise ValueError(
+                        f"Different nodes with the same id {node.id} are not supported"
+                    )
+        # CSR-Form für die Wegsuche; wird bei der ersten Anfrage aufgebaut
+        self._csr: Optional[_Csr] = None
+        # Vorgänger-Slots vollständiger Dijkstra-Läufe je Startknoten-Index, als kompaktes
+        # Zahlen-Array abgelegt. Jeder Eintrag belegt 8 Byte je Knoten; damit der Speicher nicht
+        # quadratisch in V wächst, werden nur die zuletzt genutzten `_SSSP_CACHE_SIZE` Startknoten
+        # behalten (LRU).
+        self._sssp_cache: OrderedDict[int, Sequence[int]] = OrderedDict()
+        # Anzahl der Anfragen je Startknoten-Index, die nicht aus dem Cache beantwortet wurden;
+        # wird beim Verdrängen aus dem Cache zurückgesetzt
+        self._start_queries: Dict[int, int] = {}
+
+    def _contains(self, node: Node) -> bool:
+        """Returns whether the given node object is one of the graph's nodes."""
+        return self.nodes_by_id.get(node.id) is node
+
+    def _get_csr(self) -> _Csr:
+        """Returns the CSR form of the graph, building it on first use."""
+        if self._csr is None:
+            self._csr = self._build_csr()
+        return self._csr
+
+    def _build_csr(self) -> _Csr:
+        """Builds the CSR form of the graph used by the path search."""
+        nodes = list(self.nodes_by_id.values())
+        index_by_id = {node.id: i for i, node in enumerate(nodes)}
+        end_indices = [
+            (index_by_id[edge.end_nodes[0].id], index_by_id[edge.end_nodes[1].id])
+            for edge in self.edges
+        ]
+
+        indptr = [0] * (len(nodes) + 1)
+        for a, b in end_indices:
+            if a != b:
+                indptr[a + 1] += 1
+                indptr[b + 1] += 1
+        for i in range(len(nodes)):
+            indptr[i + 1] += indptr[i]
+
+        neighbors = [0] * indptr[-1]
+        weights = [0.0] * indptr[-1]
+        csr_edges: List[UndirectedEdge] = [cast(UndirectedEdge, None)] * indptr[-1]
+        fill = indptr[:-1]
+        for edge, (a, b) in zip(self.edges, end_indices):
+            if a == b:
+                continue
+            for u, v in ((a, b), (b, a)):
+                k = fill[u]
+                neighbors[k] = v
+                weights[k] = edge.length
+                csr_edges[k] = edge
+                fill[u] = k + 1
+
+        adjacency = [
+            list(zip(neighbors[lo:hi], weights[lo:hi], range(lo, hi)))
+            for lo, hi in zip(indptr[:-1], indptr[1:])
+        ]
+
+        # Zusammenhangskomponenten per Union-Find mit Pfadhalbierung
+        parent = list(range(len(nodes)))
+        for a, b in end_indices:
+            while parent[a] != a:
+                parent[a] = a = parent[parent[a]]
+            while parent[b] != b:
+                parent[b] = b = parent[parent[b]]
+            if a != b:
+                parent[a] = b
+        component = []
+        for i in range(len(nodes)):
+            root = i
+            while parent[root] != root:
+                parent[root] = root = parent[parent[root]]
+            component.append(root)
+
+        return _Csr(
+            index_by_id, nodes, indptr, neighbors, weights, csr_edges, adjacency, component
+        )
 
 
 @total_ordering
@@ -98,14 +222,26 @@ class UndirectedPath:
     """An undirected path through a given graph."""
 
     def __init__(self, nodes: List[Node]):
+        """Creates the path from its nodes.
+
+        Every edge is looked up once via `edge_to`, which scans the adjacent edges of the node, so
+        construction costs O(deg) per hop. The path search builds its results with `_from_parts`
+        and skips this lookup.
+        """
+        edges = [node_1.edge_to(node_2) for node_1, node_2 in zip(nodes[:-1], nodes[1:])]
         assert all(
-            node_1.is_adjacent(node_2) for node_1, node_2 in zip(nodes[:-1], nodes[1:])
+            edge is not None for edge in edges
         ), "Path edges must be a chain of adjacent nodes"
         self.nodes: List[Node] = nodes
-        self.length = sum(
-            cast(UndirectedEdge, node_1.edge_to(node_2)).length
-            for node_1, node_2 in zip(nodes[:-1], nodes[1:])
-        )
+        self.length = sum(cast(UndirectedEdge, edge).length for edge in edges)
+
+    @classmethod
+    def _from_parts(cls, nodes: List[Node], length: float) -> "UndirectedPath":
+        """Creates a path from nodes already known to be a chain and its precomputed length."""
+        path = cls.__new__(cls)
+        path.nodes = nodes
+        path.length = length
+        return path
 
     @property
     def start(self) -> Node:
@@ -118,12 +254,16 @@ class UndirectedPath:
     def prepend(self, edge: UndirectedEdge) -> "UndirectedPath":
         if self.start not in edge.end_nodes:
             raise ValueError("Edge is not adjacent")
-        return UndirectedPath([edge.other_end(self.start)] + self.nodes)
+        return UndirectedPath._from_parts(
+            [edge.other_end(self.start)] + self.nodes, self.length + edge.length
+        )
 
     def append(self, edge: UndirectedEdge) -> "UndirectedPath":
         if self.end not in edge.end_nodes:
             raise ValueError("Edge is not adjacent")
-        return UndirectedPath(self.nodes + [edge.other_end(self.end)])
+        return UndirectedPath._from_parts(
+            self.nodes + [edge.other_end(self.end)], self.length + edge.length
+        )
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, UndirectedPath) and self.nodes == other.nodes
@@ -132,156 +272,241 @@ class UndirectedPath:
         return isinstance(other, UndirectedPath) and self.length <= other.length
 
     def __hash__(self) -> int:
-        return hash(n.id for n in self.nodes)
+        return hash(tuple(n.id for n in self.nodes))
 
     def __repr__(self) -> str:
         nodestr: str = ", ".join([node.__repr__() for node in self.nodes])
         return f"UndirectedPath([{nodestr}])"
 
-listerAllerPfadeVonAZuAllenKnoten = {}
+
+def _dijkstra(
+    adjacency: List[List[Tuple[int, float, int]]], source: int
+) -> Tuple[List[float], List[int]]:
+    """Runs Dijkstra's algorithm on the CSR adjacency from `source` to all reachable nodes.
+
+    Returns the distances from `source` and, per node, the CSR slot of the edge over which it is
+    reached on a shortest path (-1 for the source and for unreached nodes). The function only works
+    on lists of numbers so that the hot loop does not touch any Node or edge objects.
+    """
+    n = len(adjacency)
+    distances = [float("inf")] * n
+    distances[source] = 0.0
+    vorgänger_slot = [-1] * n
+    visited = [False] * n
+
+    # Binärheap; veraltete Einträge werden beim Herausnehmen übersprungen, daher kann der Heap im
+    # schlechtesten Fall O(E) Einträge enthalten. Ein indizierter Heap mit decrease-key hielte ihn
+    # bei höchstens V Einträgen, muss in Python aber selbst implementiert werden; in Messungen auf
+    # Zufallsgraphen (bis mittlerer Grad 1000) war das in C implementierte `heapq` trotzdem
+    # gleich schnell oder schneller.
+    pq: List[Tuple[float, int]] = [(0.0, source)]
+    while pq:
+        d, u = heappop(pq)
+        if visited[u]:
+            continue
+        visited[u] = True
+
+        for v, w, k in adjacency[u]:
+            nd = d + w
+            if nd < distances[v]:
+                distances[v] = nd
+                vorgänger_slot[v] = k
+                heappush(pq, (nd, v))
+
+    return distances, vorgänger_slot
+
+
+def _bidirectional_dijkstra(
+    adjacency: List[List[Tuple[int, float, int]]], indptr: List[int], source: int, target: int
+) -> Optional[List[int]]:
+    """Searches a shortest path from `source` to `target` simultaneously from both ends.
+
+    Both searches run Dijkstra's algorithm on the CSR adjacency, always advancing the one whose
+    heap has the smaller minimum. The search stops once the two heap minima add up to at least the
+    length of the best path found so far, as no path through unsettled nodes can be shorter.
+
+    Returns the CSR slots of the path edges in order from `source` to `target`, or None if
+    `target` is unreachable.
+    """
+    n = len(adjacency)
+    dist_f = [float("inf")] * n
+    dist_b = [float("inf")] * n
+    dist_f[source] = 0.0
+    dist_b[target] = 0.0
+    vorgänger_f = [-1] * n
+    vorgänger_b = [-1] * n
+    visited_f = [False] * n
+    visited_b = [False] * n
+    pq_f: List[Tuple[float, int]] = [(0.0, source)]
+    pq_b: List[Tuple[float, int]] = [(0.0, target)]
+
+    # Länge des besten bisher gefundenen Weges und der Knoten, in dem sich beide Suchen treffen
+    mu = 0.0 if source == target else float("inf")
+    treffpunkt = source if source == target else -1
+
+    while pq_f and pq_b and pq_f[0][0] + pq_b[0][0] < mu:
+        if pq_f[0][0] <= pq_b[0][0]:
+            pq, dist, dist_other, vorgänger, visited = pq_f, dist_f, dist_b, vorgänger_f, visited_f
+        else:
+            pq, dist, dist_other, vorgänger, visited = pq_b, dist_b, dist_f, vorgänger_b, visited_b
+
+        d, u = heappop(pq)
+        if visited[u]:
+            continue
+        visited[u] = True
+
+        for v, w, k in adjacency[u]:
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                vorgänger[v] = k
+                heappush(pq, (nd, v))
+                if nd + dist_other[v] < mu:
+                    mu = nd + dist_other[v]
+                    treffpunkt = v
+
+    if treffpunkt == -1:
+        return None
+    slots = _tree_path_slots(indptr, vorgänger_f, source, treffpunkt)
+    slots.extend(reversed(_tree_path_slots(indptr, vorgänger_b, target, treffpunkt)))
+    return slots
+
+
+def _tree_path_slots(
+    indptr: List[int], vorgänger_slot: Sequence[int], source: int, node: int
+) -> List[int]:
+    """Returns the CSR slots of the edges from `source` to `node` in a shortest path tree."""
+    slots = []
+    while node != source:
+        k = vorgänger_slot[node]
+        slots.append(k)
+        # Slot k gehört zu dem Knoten u mit indptr[u] <= k < indptr[u + 1]
+        node = bisect_right(indptr, k) - 1
+    slots.reverse()
+    return slots
+
 
 def compute_shortest_paths(
     graph: UndirectedGraph, start: Node, end: Node, length_tolerance_factor: float
 ) -> List[UndirectedPath]:
     """Computes and returns the N shortest paths between the given end nodes."""
 
-    if (start, end) in listerAllerPfadeVonAZuAllenKnoten:
-        return listerAllerPfadeVonAZuAllenKnoten[(start,end)]
+    csr = graph._get_csr()
+    if not graph._contains(start) or not graph._contains(end):
+        return [UndirectedPath([start])] if start is end else []
+    start_index = csr.index_by_id[start.id]
+    end_index = csr.index_by_id[end.id]
+    if csr.component[start_index] != csr.component[end_index]:
+        return []
+
+    # Anfragen ab `start` suchen bidirektional nur den Weg zu `end`. Wird derselbe Startknoten
+    # wiederholt angefragt, lohnt sich ein vollständiger Lauf, der die kürzesten Wege zu allen
+    # Knoten liefert und für weitere Anfragen mit diesem Startknoten zwischengespeichert wird.
+    # Ein aus dem Cache verdrängter Startknoten muss sich erst erneut dafür qualifizieren.
+    cache = graph._sssp_cache
+    anfragen = graph._start_queries.get(start_index, 0) + 1
+    if start_index in cache or anfragen >= graph._SSSP_PROMOTE_AFTER:
+        if start_index in cache:
+            cache.move_to_end(start_index)
+        else:
+            _, vorgänger_slot = _dijkstra(csr.adjacency, start_index)
+            cache[start_index] = array("q", vorgänger_slot)
+            if len(cache) > graph._SSSP_CACHE_SIZE:
+                verdrängt, _ = cache.popitem(last=False)
+                graph._start_queries.pop(verdrängt, None)
+        slots = _tree_path_slots(csr.indptr, cache[start_index], start_index, end_index)
     else:
+        graph._start_queries[start_index] = anfragen
+        gefunden = _bidirectional_dijkstra(csr.adjacency, csr.indptr, start_index, end_index)
+        # Nur zur Absicherung: nach der Komponentenprüfung oben ist `end` immer erreichbar.
+        if gefunden is None:
+            return []
+        slots = gefunden
+
+    # Die Knoten ergeben sich durch Ablaufen der Kanten ab `start` und bilden so per Konstruktion
+    # eine Kette; die Prüfung und Längenberechnung in UndirectedPath.__init__ entfallen daher.
+    listeKnoten = [csr.nodes[start_index]] * (len(slots) + 1)
+    länge = 0.0
+    for i, k in enumerate(slots):
+        listeKnoten[i + 1] = csr.edges[k].other_end(listeKnoten[i])
+        länge += csr.weights[k]
+
+    return [UndirectedPath._from_parts(listeKnoten, länge)]
+
+
+def compute_shortest_paths_for_many(
+    graph: UndirectedGraph, start_end_pairs: List[Tuple[Node, Node]]
+) -> List[List[UndirectedPath]]:
+    """Computes the shortest path for many pairs of end nodes at once.
+
+    Returns one list per pair in the same format as `compute_shortest_paths` with a length
+    tolerance factor of 1.0. All distinct start nodes are searched in a single call to SciPy's
+    compiled Dijkstra implementation, which pays off when many start nodes are involved.
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+
+    csr = graph._get_csr()
+
+    start_indices = sorted(
+        {csr.index_by_id[start.id] for start, _ in start_end_pairs if graph._contains(start)}
+    )
+    row_by_start_index = {start_index: row for row, start_index in enumerate(start_indices)}
+    distances = predecessors = None
+    if start_indices:
+        matrix = csr_matrix(
+            (csr.weights, csr.neighbors, csr.indptr), shape=(len(csr.nodes), len(csr.nodes))
+        )
+        distances, predecessors = dijkstra(
+            matrix, directed=True, indices=start_indices, return_predecessors=True
+        )
 
-
-        distances = {}
-        for _, node in graph.nodes_by_id.items():
-            
-            distances[node] = float("inf")
-
-        distances[start] = 0
-        warteschlange = []
-        erledigt = []
-        ausgewählt = start
-        vorgänger = {}
-        zähleDurchläufe = 0
-        listeKnoten = []
-
-        while True:
-            zähleDurchläufe += 1
-            nachfolger = []
-
-            for edge in ausgewählt.adjacent_edges:
-                if edge.other_end(ausgewählt) not in erledigt:
-                    nachfolger.append(edge.other_end(ausgewählt))
-                if (edge.other_end(ausgewählt) not in warteschlange) and (edge.other_end(ausgewählt) not in erledigt):
-                    warteschlange.append(edge.other_end(ausgewählt))
-
-            for n in nachfolger:
-                if (ausgewählt.edge_to(n) not in erledigt) and (ausgewählt.edge_to(n) not in vorgänger):
-                    new_distance = distances[ausgewählt] + ausgewählt.edge_to(n).length
-
-                    if new_distance < distances[n]:
-                        distances[n] = new_distance
-                        vorgänger[n] = ausgewählt
-
-            if ausgewählt not in erledigt:
-                erledigt.append(ausgewählt)
-
-            if len(erledigt) == 5:
-                break
-
-            if ausgewählt in warteschlange:
-                warteschlange.remove(ausgewählt)
-
-            if len(warteschlange) > 1:
-                nHilf = warteschlange[0]
-                for n in warteschlange[1:]:
-                    if distances[nHilf] > distances[n]:
-                        nHilf = n
-                ausgewählt = nHilf
-            elif len(warteschlange) == 1:
-                ausgewählt = warteschlange[0]
-            else:
-                break
-
-        vorgänger_umgedreht = {}
-        for schlüssel, wert in vorgänger.items():
-            vorgänger_umgedreht.setdefault(wert, []).append(schlüssel)
-        #print("vorgänger_umgedreht Ende: ", vorgänger_umgedreht)
-
-        #vorgänger_umgedreht = {wert: schlüssel for schlüssel, wert in vorgänger.items()}
-        print("vorgänger Ende: ", vorgänger)
-        print("vorgänger_umgedreht: ", vorgänger_umgedreht)
-
-        listeKnoten.append(end)
-        knotenHilf = vorgänger[end]
-
-        for i in range(len(vorgänger)-1):
-            listeKnoten.append(knotenHilf)
-            if knotenHilf in vorgänger:
-                knotenHilf = vorgänger[knotenHilf]
-            else:
-                break
-
+    results: List[List[UndirectedPath]] = []
+    for start, end in start_end_pairs:
+        if not graph._contains(start) or not graph._contains(end):
+            results.append([UndirectedPath([start])] if start is end else [])
+            continue
+        row = row_by_start_index[csr.index_by_id[start.id]]
+        end_index = csr.index_by_id[end.id]
+        if distances[row, end_index] == float("inf"):
+            results.append([])
+            continue
+
+        listeKnoten = [end_index]
+        while listeKnoten[-1] != start_indices[row]:
+            listeKnoten.append(int(predecessors[row, listeKnoten[-1]]))
         listeKnoten.reverse()
-        print("Liste des Pfades: ", listeKnoten)
-
-        p = UndirectedPath(listeKnoten)
-
-        s = start
-        e = end
-        listerAllerPfadeVonAZuAllenKnoten[(s,e)]=p
-
-        listeSchlüssel = vorgänger.keys()
-        for i in listeSchlüssel: 
-            listeNeuerPfad = [i]
-            e = i
-            if i == end or i == start:
-                continue
-            else:
-                while True:
-                    if i in vorgänger:
-                        listeNeuerPfad.append(vorgänger[i])
-                        i = vorgänger[i]
-                    else:
-                        listeNeuerPfad.reverse()
-                        if not (s,e) in listerAllerPfadeVonAZuAllenKnoten: 
-                            listerAllerPfadeVonAZuAllenKnoten[(s,e)] = (UndirectedPath(listeNeuerPfad))
-                        break
-
-        return [p]
-
-    
-
-# Usage example
-n1, n2, n3, n4, n5 = Node(1), Node(2), Node(3), Node(4), Node(5)
-demo_graph = UndirectedGraph(
-    [
-        UndirectedEdge((n1, n2), 20),
-        UndirectedEdge((n1, n5), 10),
-        UndirectedEdge((n2, n5), 20),
-        UndirectedEdge((n2, n4), 50),
-        UndirectedEdge((n2, n3), 20),
-        UndirectedEdge((n3, n4), 10),
-        UndirectedEdge((n5, n4), 50),
-        
-    ]
-)
-
-print("n4->n1: ", compute_shortest_paths(demo_graph, n4, n1, 1.0))
-print("n4->n2: ", compute_shortest_paths(demo_graph, n4, n2, 1.0))
-print("n1->n3: ", compute_shortest_paths(demo_graph, n1, n3, 1.0))
-print("n2->n5: ", compute_shortest_paths(demo_graph, n2, n5, 1.0))
-print("n3->n5: ", compute_shortest_paths(demo_graph, n3, n5, 1.0))
-
-
-print("\n\n\nAlle Pfade von A zu allen anderen Knoten: ", listerAllerPfadeVonAZuAllenKnoten)               
-print("\nLänge von der Liste mit Allen Pfaden: ", len(listerAllerPfadeVonAZuAllenKnoten))
-#In der Liste listeAllerPfadeVonAZuAllenKnoten sind jetzt alle Knoten von A zu allen anderen Knoten vorhanden.
-#Sobald ich den kürzesten Pfad von A nach B suche, liefert die Methode diesen Pfad. Zusätzlich werden die kürzesten Wege
-#zu allen anderen Knoten mit dem Dijkstra-Algorithmus berechnet und in der eben genannten Liste abgespeichert. 
-#Somit müssen diese Pfade nicht erneut berechnet werden. Dieser Algorthmus ist sehr effektiv, denn
-#indem man den kürzesten Pfad von A nach B berechnet, muss man sowieso alle Wege betrachten. 
-
-# Should print the paths [1, 2, 4], [1, 3, 4], [1, 2, 4, 2, 4], [1, 2, 1, 2, 4], [1, 2, 4, 3, 4]
-#print(compute_shortest_paths(demo_graph, n1, n4, 2.0))
-
-
+        results.append(
+            [
+                UndirectedPath._from_parts(
+                    [csr.nodes[i] for i in listeKnoten], float(distances[row, end_index])
+                )
+            ]
+        )
 
+    return results
+
+
+if __name__ == "__main__":
+    # Usage example
+    n1, n2, n3, n4, n5 = Node(1), Node(2), Node(3), Node(4), Node(5)
+    demo_graph = UndirectedGraph(
+        [
+            UndirectedEdge((n1, n2), 20),
+            UndirectedEdge((n1, n5), 10),
+            UndirectedEdge((n2, n5), 20),
+            UndirectedEdge((n2, n4), 50),
+            UndirectedEdge((n2, n3), 20),
+            UndirectedEdge((n3, n4), 10),
+            UndirectedEdge((n5, n4), 50),
+        ]
+    )
+
+    print("n4->n1: ", compute_shortest_paths(demo_graph, n4, n1, 1.0))
+    print("n4->n2: ", compute_shortest_paths(demo_graph, n4, n2, 1.0))
+    print("n1->n3: ", compute_shortest_paths(demo_graph, n1, n3, 1.0))
+    print("n2->n5: ", compute_shortest_paths(demo_graph, n2, n5, 1.0))
+    print("n3->n5: ", compute_shortest_paths(demo_graph, n3, n5, 1.0))
+
+    # Should print the paths [1, 2, 4], [1, 3, 4], [1, 2, 4, 2, 4], [1, 2, 1, 2, 4], [1, 2, 4, 3, 4]
+    #print(compute_shortest_paths(demo_graph, n1, n4, 2.0))
@@ -0,0 +1,222 @@
+"""Tests for `compute_shortest_paths` in path_discovery (1).py."""
+import importlib.util
+import os
+import random
+import unittest
+from unittest import mock
+
+_spec = importlib.util.spec_from_file_location(
+    "path_discovery", os.path.join(os.path.dirname(__file__), "path_discovery (1).py")
+)
+path_discovery = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(path_discovery)
+
+Node = path_discovery.Node
+UndirectedEdge = path_discovery.UndirectedEdge
+UndirectedGraph = path_discovery.UndirectedGraph
+UndirectedPath = path_discovery.UndirectedPath
+compute_shortest_paths = path_discovery.compute_shortest_paths
+compute_shortest_paths_for_many = path_discovery.compute_shortest_paths_for_many
+
+try:
+    import scipy
+except ImportError:
+    scipy = None
+
+
+def demo_graph():
+    """Returns the demo graph from the module's usage example and its nodes by id."""
+    nodes = {i: Node(i) for i in range(1, 6)}
+    graph = UndirectedGraph(
+        [
+            UndirectedEdge((nodes[1], nodes[2]), 20),
+            UndirectedEdge((nodes[1], nodes[5]), 10),
+            UndirectedEdge((nodes[2], nodes[5]), 20),
+            UndirectedEdge((nodes[2], nodes[4]), 50),
+            UndirectedEdge((nodes[2], nodes[3]), 20),
+            UndirectedEdge((nodes[3], nodes[4]), 10),
+            UndirectedEdge((nodes[5], nodes[4]), 50),
+        ]
+    )
+    return graph, nodes
+
+
+class ComputeShortestPathsTest(unittest.TestCase):
+    def assertPath(self, paths, node_ids, length):
+        self.assertEqual(len(paths), 1)
+        self.assertEqual([node.id for node in paths[0].nodes], node_ids)
+        self.assertEqual(paths[0].length, length)
+        self.assertEqual(UndirectedPath(paths[0].nodes).length, length)
+
+    def test_demo_graph_first_query_per_start(self):
+        graph, n = demo_graph()
+        self.assertPath(compute_shortest_paths(graph, n[4], n[1], 1.0), [4, 3, 2, 1], 50)
+        self.assertPath(compute_shortest_paths(graph, n[1], n[3], 1.0), [1, 2, 3], 40)
+        self.assertPath(compute_shortest_paths(graph, n[2], n[5], 1.0), [2, 5], 20)
+        self.assertPath(compute_shortest_paths(graph, n[3], n[5], 1.0), [3, 2, 5], 40)
+
+    def test_demo_graph_repeated_query_per_start(self):
+        graph, n = demo_graph()
+        # Early queries from a start search bidirectionally, later ones use the cached tree.
+        for _ in range(3):
+            self.assertPath(compute_shortest_paths(graph, n[4], n[1], 1.0), [4, 3, 2, 1], 50)
+            self.assertPath(compute_shortest_paths(graph, n[4], n[2], 1.0), [4, 3, 2], 30)
+            self.assertPath(compute_shortest_paths(graph, n[4], n[3], 1.0), [4, 3], 10)
+
+    def test_cached_starts_are_bounded(self):
+        nodes = [Node(i) for i in range(40)]
+        graph = UndirectedGraph(
+            [UndirectedEdge((nodes[i], nodes[i + 1]), 1) for i in range(len(nodes) - 1)]
+        )
+        for _ in range(2):
+            for node in nodes:
+                self.assertPath(
+                    compute_shortest_paths(graph, node, nodes[0], 1.0),
+                    list(range(node.id, -1, -1)),
+                    node.id,
+                )
+        self.assertLessEqual(len(graph._sssp_cache), UndirectedGraph._SSSP_CACHE_SIZE)
+
+    def test_evicted_start_falls_back_to_bidirectional_search(self):
+        nodes = [Node(i) for i in range(40)]
+        graph = UndirectedGraph(
+            [UndirectedEdge((nodes[i], nodes[i + 1]), 1) for i in range(len(nodes) - 1)]
+        )
+        for node in nodes:
+            for _ in range(UndirectedGraph._SSSP_PROMOTE_AFTER):
+                compute_shortest_paths(graph, node, nodes[-1], 1.0)
+        self.assertNotIn(graph._get_csr().index_by_id[0], graph._sssp_cache)
+
+        with mock.patch.object(
+            path_discovery, "_dijkstra", wraps=path_discovery._dijkstra
+        ) as dijkstra:
+            self.assertPath(
+                compute_shortest_paths(graph, nodes[0], nodes[-1], 1.0), list(range(40)), 39
+            )
+            dijkstra.assert_not_called()
+
+    def test_start_is_end(self):
+        graph, n = demo_graph()
+        for _ in range(2):
+            self.assertPath(compute_shortest_paths(graph, n[3], n[3], 1.0), [3], 0)
+
+    def test_disconnected_end(self):
+        graph, n = demo_graph()
+        a, b = Node(6), Node(7)
+        graph = UndirectedGraph(graph.edges + [UndirectedEdge((a, b), 1)])
+        for _ in range(2):
+            self.assertEqual(compute_shortest_paths(graph, n[1], a, 1.0), [])
+            self.assertEqual(compute_shortest_paths(graph, b, n[4], 1.0), [])
+
+    def test_end_not_in_graph(self):
+        graph, n = demo_graph()
+        outside = Node(8)
+        self.assertEqual(compute_shortest_paths(graph, n[1], outside, 1.0), [])
+        self.assertEqual(compute_shortest_paths(graph, outside, n[1], 1.0), [])
+        self.assertPath(compute_shortest_paths(graph, outside, outside, 1.0), [8], 0)
+
+
+@unittest.skipIf(scipy is None, "SciPy is not installed")
+class ComputeShortestPathsForManyTest(unittest.TestCase):
+    def test_matches_compute_shortest_paths(self):
+        rng = random.Random(0)
+        nodes = [Node(i) for i in range(60)]
+        edges = []
+        end_ids = set()
+        while len(edges) < 100:
+            a, b = rng.sample(range(len(nodes)), 2)
+            if frozenset((a, b)) not in end_ids:
+                end_ids.add(frozenset((a, b)))
+                edges.append(UndirectedEdge((nodes[a], nodes[b]), rng.uniform(0.5, 10)))
+        graph = UndirectedGraph(edges)
+        pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(200)]
+        pairs.append((nodes[0], Node(99)))
+
+        for (start, end), paths in zip(pairs, compute_shortest_paths_for_many(graph, pairs)):
+            expected = compute_shortest_paths(graph, start, end, 1.0)
+            self.assertEqual(len(paths), len(expected))
+            if expected:
+                self.assertAlmostEqual(paths[0].length, expected[0].length)
+                self.assertIs(paths[0].start, start)
+                self.assertIs(paths[0].end, end)
+                self.assertAlmostEqual(UndirectedPath(paths[0].nodes).length, paths[0].length)
+
+
+class UndirectedGraphTest(unittest.TestCase):
+    def test_different_nodes_with_same_id_are_rejected(self):
+        n1, n2, n2_copy, n3 = Node(1), Node(2), Node(2), Node(3)
+        with self.assertRaises(ValueError):
+            UndirectedGraph([UndirectedEdge((n1, n2), 1), UndirectedEdge((n3, n2_copy), 1)])
+
+    def test_duplicate_edges_are_rejected(self):
+        n1, n2 = Node(1), Node(2)
+        edge = UndirectedEdge((n1, n2), 1)
+        duplicate = UndirectedEdge((n2, n1), 2)
+        with self.assertRaises(ValueError):
+            UndirectedGraph([edge, duplicate])
+        self.assertEqual(n1.adjacent_edges, [edge])
+        self.assertEqual(n2.adjacent_edges, [edge])
+
+    def test_same_edge_object_listed_twice_is_allowed(self):
+        n1, n2, n3 = Node(1), Node(2), Node(3)
+        edge = UndirectedEdge((n1, n2), 1)
+        other = UndirectedEdge((n2, n3), 2)
+        graph = UndirectedGraph([edge, other, edge])
+        self.assertEqual(n1.adjacent_edges, [edge])
+        self.assertEqual(UndirectedPath([n1, n2, n3]).length, 3)
+        self.assertEqual(compute_shortest_paths(graph, n1, n3, 1.0)[0].length, 3)
+
+    def test_repeated_self_loops_are_allowed(self):
+        n1, n2 = Node(1), Node(2)
+        graph = UndirectedGraph(
+            [UndirectedEdge((n1, n1), 1), UndirectedEdge((n1, n1), 2), UndirectedEdge((n1, n2), 3)]
+        )
+        self.assertEqual(compute_shortest_paths(graph, n1, n2, 1.0)[0].length, 3)
+
+    def test_node_with_graph_id_but_other_object_is_not_in_graph(self):
+        graph, n = demo_graph()
+        self.assertEqual(compute_shortest_paths(graph, n[1], Node(3), 1.0), [])
+
+
+class UndirectedPathTest(unittest.TestCase):
+    def test_prepend_and_append_keep_length(self):
+        n1, n2, n3, n4 = Node(1), Node(2), Node(3), Node(4)
+        e12, e23, e34 = (
+            UndirectedEdge((n1, n2), 1),
+            UndirectedEdge((n2, n3), 2),
+            UndirectedEdge((n3, n4), 4),
+        )
+        path = UndirectedPath([n2, n3]).prepend(e12).append(e34)
+        self.assertEqual(path.nodes, [n1, n2, n3, n4])
+        self.assertEqual(path.length, 7)
+        self.assertEqual(path.length, UndirectedPath(path.nodes).length)
+        with self.assertRaises(ValueError):
+            path.append(e23)
+
+    def test_equal_paths_hash_equally(self):
+        n1, n2, n3 = Node(1), Node(2), Node(3)
+        UndirectedEdge((n1, n2), 1)
+        UndirectedEdge((n2, n3), 1)
+        path = UndirectedPath([n1, n2, n3])
+        same = UndirectedPath([n1, n2, n3])
+        self.assertEqual(hash(path), hash(same))
+        self.assertEqual(len({path, same, UndirectedPath([n1, n2])}), 2)
+
+
+class UndirectedEdgeTest(unittest.TestCase):
+    def test_is_adjacent(self):
+        n1, n2, n3, n4 = Node(1), Node(2), Node(3), Node(4)
+        e12 = UndirectedEdge((n1, n2), 1)
+        self.assertTrue(e12.is_adjacent(UndirectedEdge((n2, n3), 1)))
+        self.assertFalse(e12.is_adjacent(UndirectedEdge((n3, n4), 1)))
+
+    def test_is_adjacent_with_self_loops(self):
+        n1, n2 = Node(1), Node(2)
+        loop = UndirectedEdge((n1, n1), 1)
+        self.assertTrue(loop.is_adjacent(UndirectedEdge((n1, n2), 1)))
+        self.assertTrue(loop.is_adjacent(loop))
+        self.assertFalse(loop.is_adjacent(UndirectedEdge((n2, n2), 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()